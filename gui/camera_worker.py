@@ -0,0 +1,90 @@
+import cv2
+
+import threading
+import time
+
+
+class CameraWorker:
+    def __init__(self, cap: cv2.VideoCapture, process=None):
+        """
+        Reads camera frames on a background thread so the game loop never waits on the camera.
+
+        Args:
+            cap (cv2.VideoCapture): The camera to read the frames from.
+            process (callable): Function applied to every new frame in the background thread,
+                                its return value is what the game loop reads. Default is None (raw frame).
+        """
+        self.cap = cap
+        self.process = process
+        self.latest_lock = threading.Lock()
+        self.first_frame_ready = threading.Event()
+        self.running = False
+        self.thread = None
+        self._latest = None
+        self._error = None
+
+    @property
+    def latest(self):
+        """The most recent processed frame, or None if no frame was read yet"""
+        with self.latest_lock:
+            return self._latest
+
+    def start(self) -> None:
+        """
+        Start reading the camera frames in a daemon thread.
+        """
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and wait for the current frame to finish.
+        """
+        self.running = False
+        if self.thread is not None:
+            # Wait until the thread has exited, so a new worker never shares the camera with it
+            self.thread.join()
+            self.thread = None
+
+    def read(self, timeout: float = 5.0):
+        """
+        Get the most recent processed frame, waiting for the first one if needed.
+
+        Args:
+            timeout (float): Seconds to wait for the first frame. Default is 5.0.
+
+        Returns:
+            The return value of process for the most recent camera frame.
+
+        Raises:
+            RuntimeError: If no frame was read from the camera within the timeout.
+            Exception: The exception raised while reading or processing a frame in the background thread.
+        """
+        if not self.first_frame_ready.wait(timeout):
+            raise RuntimeError(
+                f"No frame was read from the camera within {timeout} seconds"
+            )
+        if self._error is not None:
+            raise self._error
+        return self.latest
+
+    def run(self) -> None:
+        try:
+            while self.running:
+                # OpenCV and Mediapipe release the GIL while reading and processing the frame
+                ret, frame = self.cap.read()
+                if not ret:
+                    time.sleep(0.01)
+                    continue
+
+                result = self.process(frame) if self.process is not None else frame
+
+                with self.latest_lock:
+                    self._latest = result
+                self.first_frame_ready.set()
+        except Exception as error:
+            # Hand the error to the game loop, it is raised again from read
+            self._error = error
+            self.running = False
+            self.first_frame_ready.set()
@@ -5,6 +5,7 @@ from pygame.locals import *
 from pygame import mixer
 
 import cv2
+import numpy as np
 
 import random
 import time
@@ -17,12 +18,16 @@ from models.mediapipe_hand_tracking import HandTrackingDynamic
 from models.cvzone_hand_detection import initialize_hand_detector, detect_hands
 from screeninfo import get_monitors
 
+from gui.camera_worker import CameraWorker
 from gui.utils import img_with_rounded_corners, random_bool_by_chance, biased_random_int
 
 
 # Get the current working directory
 CWD = os.path.dirname(os.path.abspath(__file__))
 
+# The fingers centers of a hand that was not detected
+_NEG_FIVE = [(-1, -1)] * 5
+
 
 class Game:
     def __init__(self):
@@ -71,6 +76,10 @@ class Game:
         # Set the window title
         pygame.display.set_caption(self.game_name)
 
+        # Initialize the center of the screen for centering the texts
+        self._cx = self.screen.get_width() // 2
+        self._cy = self.screen.get_height() // 2
+
         # Initialize the clock for controlling the frame rate and delta time
         self.clock = pygame.time.Clock()
         self.dt = 0
@@ -86,6 +95,7 @@ class Game:
 
         # Initialize the font for the game
         self.font_path = f"{CWD}/resources/fonts/joystix monospace.otf"
+        self._font_cache = {}
 
         # Seed the random number generator
         random.seed(time.time())
@@ -145,6 +155,11 @@ class Game:
         # Apply difficulty settings
         self.difficulty = self.settings["difficulty"]
 
+        # Resolve the Pong speed modifier once so the game reads a plain attribute
+        self.pong_speed_mul = DIFFICULTY_SETTINGS.get(
+            self.difficulty, DIFFICULTY_SETTINGS["Normal"]
+        )["pong_speed"]
+
     def setup_database(self):
         """Set up SQLite database for user management"""
         # Create a database in the same directory as the script
@@ -339,13 +354,32 @@ class Game:
         # Initialize the camera image
         self.camera_image = None
 
+        # Initialize the background camera reader
+        self.camera_worker = None
+
+    def start_camera_worker(self, process):
+        # Stop any previous camera reader, only one thread may read from the camera
+        self.stop_camera_worker()
+
+        # Read and process the camera images in the background
+        self.camera_worker = CameraWorker(self.cap, process)
+        self.camera_worker.start()
+
+    def stop_camera_worker(self):
+        if self.camera_worker is not None:
+            self.camera_worker.stop()
+            self.camera_worker = None
+
     def init_finger_detection(self):
         # Initialize the HandDetector object
         self.finger_detector = initialize_hand_detector()
 
     def init_hand_tracking(self):
-        # Initialize the HandDetector object
-        self.hand_tracking = HandTrackingDynamic()
+        # Initialize the hand tracker used by Pong, the detection is skipped while the hands are
+        # still for at most 5 detections, so a hand entering elsewhere is found within 10 frames
+        self.hand_tracking = HandTrackingDynamic(
+            modelComplexity=0, motionThresh=3.0, maxReuseFrames=5
+        )
 
     def init_theme(self):
         # Set the background image
@@ -355,7 +389,7 @@ class Game:
         )
 
         # Create a theme
-        font = pygame.font.Font(self.font_path, 50)
+        font = self._font(50)
         self.theme = Theme(
             background_color=self.menu_bg_image,
             title_bar_style=pygame_menu.widgets.MENUBAR_STYLE_NONE,
@@ -522,6 +556,12 @@ class Game:
         )
 
     def start_main_menu(self):
+        # Stop reading the camera in the background
+        self.stop_camera_worker()
+
+        # Allow all the event types again for the menu
+        pygame.event.set_allowed(None)
+
         # Set the background music for the main menu
         mixer.music.load(f"{CWD}/resources/sounds/main_menu_bg_music.ogg")
         mixer.music.set_volume(0.1)
@@ -570,14 +610,14 @@ class Game:
         self.texts = []
 
         # Add the game name to the top center of the screen
-        font = pygame.font.Font(self.font_path, 50)
+        font = self._font(50)
         text = font.render(self.game_name, True, (255, 255, 255), (0, 0, 0))
         self.texts.append(text)
-        text_rect = text.get_rect(center=(self.screen.get_width() // 2, 150))
+        text_rect = text.get_rect(center=(self._cx, 150))
         self.text_rects.append(text_rect)
 
         # Add the credits to the screen
-        font = pygame.font.Font(self.font_path, 30)
+        font = self._font(30)
         y = 300
         for key, value in self.credits_dict.items():
             text_key = font.render(key, True, (255, 255, 255), (0, 0, 0))
@@ -606,9 +646,7 @@ class Game:
             (0, 0, 0),
         )
         self.texts.append(text)
-        text_rect = text.get_rect(
-            center=(self.screen.get_width() // 2, self.screen.get_height() - 100)
-        )
+        text_rect = text.get_rect(center=(self._cx, self.screen.get_height() - 100))
         self.text_rects.append(text_rect)
 
         # Start the credits dialog
@@ -625,7 +663,7 @@ class Game:
         is_space = False
 
         while True:
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -660,6 +698,23 @@ class Game:
             # Update the display
             pygame.display.flip()
 
+    def _font(self, size):
+        """Get the game font in the given size, loading it only the first time"""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = self._font_cache[size] = pygame.font.Font(self.font_path, size)
+
+        return font
+
+    def get_game_events(self):
+        """Get the pending quit and key down events and discard the rest"""
+        events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN])
+
+        # Drop the unwanted events (mouse motion, audio, etc.) so they don't pile up in the queue
+        pygame.event.clear(pump=False)
+
+        return events
+
     def toggle_bg_music(self):
         # Mute or unmute the background music
         if self.bg_music_muted:
@@ -677,6 +732,17 @@ class Game:
         # Unmute the background music
         mixer.music.set_volume(0.1)
 
+    def scale_bg_image(self, bg_image):
+        # Convert the background image to a Pygame image
+        bg_image_pygame = pygame.image.frombuffer(
+            bg_image.tobytes(), (bg_image.shape[1], bg_image.shape[0]), "RGBA"
+        )
+
+        # Resize the background image to fit the screen and convert it to the display format for fast blits
+        return pygame.transform.scale(
+            bg_image_pygame, (self.user_screen_width, self.user_screen_height)
+        ).convert()
+
     def init_balloons_game(self):
         # Set the background music for the main menu
         mixer.music.load(f"{CWD}/resources/sounds/balloon_game_bg_music.ogg")
@@ -728,6 +794,19 @@ class Game:
             self.balloons_game_bg_image, cv2.COLOR_RGB2RGBA
         )
 
+        # Convert and scale the background image once for the screens without the camera
+        self._bg_static_pygame = self.scale_bg_image(self.balloons_game_bg_image)
+
+        # Initialize the background buffer the camera image is written into every frame,
+        # the camera area never moves so the rest of the buffer is never written again
+        self._bg_buf = self.balloons_game_bg_image.copy()
+
+        # Calculate the position that centers the background image on the screen
+        self._bg_blit_pos = (
+            (self.user_screen_width - self._bg_static_pygame.get_width()) // 2,
+            (self.user_screen_height - self._bg_static_pygame.get_height()) // 2,
+        )
+
         # Initialize the pin image
         self.pin_image = pygame.image.load(f"{CWD}/resources/images/pin.png")
 
@@ -790,6 +869,10 @@ class Game:
         self.translation_x_cam = int(self.start_x_cam * self.scale_x_cam)
         self.translation_y_cam = int(self.start_y_cam * self.scale_y_cam)
 
+        # Initialize the fingers centers rects buffer (x, y, width, height) for both hands
+        self._finger_rects_buf = np.full((10, 4), -1, np.int32)
+        self._finger_rects_buf[:, 2:] = 20
+
         # Initialize the score
         self.balloons_score = 0
 
@@ -831,6 +914,12 @@ class Game:
             f"{CWD}/resources/images/balloon-combo-3.png",
         ]
 
+        # Initialize the balloon type of each image path (the combo number in the file name)
+        self._path_to_type = {path: 0 for path in normal_balloon_image_paths}
+        self._path_to_type.update(
+            {path: int(path.split(".")[-2][-1]) for path in combo_balloon_image_paths}
+        )
+
         # Initialize the balloons waves configurations
         ballons_number_per_wave = [
             [5, 15],
@@ -899,9 +988,7 @@ class Game:
                 apperance_time = biased_random_int(
                     0, self.max_wave_time, (0, self.max_wave_time // 2), 10
                 )
-                balloon_type = (
-                    0 if not is_combo else int(balloon_img_path.split(".")[-2][-1])
-                )
+                balloon_type = self._path_to_type[balloon_img_path]
 
                 balloons.append(
                     {
@@ -927,8 +1014,11 @@ class Game:
         # Play the balloon popping fill sound
         self.balloon_popping_fill_sounds.play()
 
+        # Only the timer text changes after the first frame
+        previous_timer_text_rect = None
+
         while True:
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -937,32 +1027,8 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         self.start_main_menu()
 
-            # Convert the background image to a Pygame image
-            self.balloons_game_bg_image_pygame = pygame.image.frombuffer(
-                self.balloons_game_bg_image.tobytes(),
-                (
-                    self.balloons_game_bg_image.shape[1],
-                    self.balloons_game_bg_image.shape[0],
-                ),
-                "RGBA",
-            )
-
-            # Resize the background image to fit the screen
-            self.balloons_game_bg_image_pygame = pygame.transform.scale(
-                self.balloons_game_bg_image_pygame,
-                (self.user_screen_width, self.user_screen_height),
-            )
-
             # Draw the balloon game background image to the center of the screen
-            self.screen.blit(
-                self.balloons_game_bg_image_pygame,
-                (
-                    self.screen.get_width() / 2
-                    - self.balloons_game_bg_image_pygame.get_width() / 2,
-                    self.screen.get_height() / 2
-                    - self.balloons_game_bg_image_pygame.get_height() / 2,
-                ),
-            )
+            self.screen.blit(self._bg_static_pygame, self._bg_blit_pos)
 
             time_elapsed = int(time.time() - start_time)
             other_time_remaining = self.balloon_wave_wait_time - time_elapsed
@@ -975,7 +1041,7 @@ class Game:
             )
 
             # Add the timer to the center of the screen
-            font = pygame.font.Font(self.font_path, 40)
+            font = self._font(40)
             text = font.render(
                 f"Wave {self.balloons_wave} starts in {time_remaining} seconds",
                 True,
@@ -983,42 +1049,28 @@ class Game:
                 (0, 0, 0),
             )
             if self.balloons_wave == 1:
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2 - 200,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy - 200))
             else:
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy))
             self.screen.blit(text, text_rect)
+            timer_text_rect = text_rect
 
             # Add the game name to the top center of the screen
-            font = pygame.font.Font(self.font_path, 50)
+            font = self._font(50)
             text = font.render("Balloons Game", True, (255, 255, 255), (0, 0, 0))
-            text_rect = text.get_rect(center=(self.screen.get_width() // 2, 150))
+            text_rect = text.get_rect(center=(self._cx, 150))
             self.screen.blit(text, text_rect)
 
             # Show instructions if the wave is 1
             if self.balloons_wave == 1:
-                font = pygame.font.Font(self.font_path, 30)
+                font = self._font(30)
                 text = font.render(
                     "Pop the balloons with your fingers",
                     True,
                     (255, 255, 255),
                     (0, 0, 0),
                 )
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy))
                 self.screen.blit(text, text_rect)
 
                 text = font.render(
@@ -1027,12 +1079,7 @@ class Game:
                     (255, 255, 255),
                     (0, 0, 0),
                 )
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2 + 50,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy + 50))
                 self.screen.blit(text, text_rect)
 
                 text = font.render(
@@ -1041,12 +1088,7 @@ class Game:
                     (255, 255, 255),
                     (0, 0, 0),
                 )
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2 + 100,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy + 100))
                 self.screen.blit(text, text_rect)
 
                 text = font.render(
@@ -1055,12 +1097,7 @@ class Game:
                     (255, 255, 255),
                     (0, 0, 0),
                 )
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2 + 150,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy + 150))
                 self.screen.blit(text, text_rect)
 
                 text = font.render(
@@ -1069,12 +1106,7 @@ class Game:
                     (255, 255, 255),
                     (0, 0, 0),
                 )
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2 + 200,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy + 200))
                 self.screen.blit(text, text_rect)
 
                 text = font.render(
@@ -1083,16 +1115,15 @@ class Game:
                     (255, 255, 255),
                     (0, 0, 0),
                 )
-                text_rect = text.get_rect(
-                    center=(
-                        self.screen.get_width() // 2,
-                        self.screen.get_height() // 2 + 250,
-                    )
-                )
+                text_rect = text.get_rect(center=(self._cx, self._cy + 250))
                 self.screen.blit(text, text_rect)
 
-            # Update the display
-            pygame.display.flip()
+            # Update the whole display once, then only the area of the timer text
+            if previous_timer_text_rect is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update([timer_text_rect.union(previous_timer_text_rect)])
+            previous_timer_text_rect = timer_text_rect
 
             if time_remaining <= 0:
                 break
@@ -1102,12 +1133,53 @@ class Game:
         # Start the Balloons game
         self.start_balloons_game()
 
+    def process_balloons_frame(self, frame):
+        # Swap the color channels
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # Flip the camera image horizontally
+        frame = cv2.flip(frame, 1)
+
+        # Scale the camera image to be half the size of the screen
+        frame = cv2.resize(
+            frame,
+            (
+                int(self.user_screen_width // self.balloon_screen_ratio),
+                int(self.user_screen_height // self.balloon_screen_ratio),
+            ),
+        )
+
+        # Detect the hands
+        hands_data = detect_hands(self.finger_detector, frame)
+
+        return frame, hands_data
+
+    def render_hud_text(self, key, label, value):
+        # Render the HUD text again only if its value changed since the last frame
+        cached_value, text = self._hud_cache[key]
+        if value != cached_value:
+            text = self._hud_font.render(f"{label}:{value}", True, (255, 255, 255))
+            self._hud_cache[key] = (value, text)
+
+        return text
+
     def start_balloons_game(self):
 
+        # Capture the camera and detect the hands in the background
+        self.start_camera_worker(self.process_balloons_frame)
+
+        # Initialize the HUD texts, they are rendered again only when their value changes
+        self._hud_font = self._font(36)
+        self._hud_cache = {
+            "score": (None, None),
+            "time": (None, None),
+            "wave": (None, None),
+        }
+
         start_time = time.time()
 
         while True:
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -1116,82 +1188,43 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         self.start_main_menu()
 
-            # Take a camera image
-            _, self.camera_image = self.cap.read()
-
-            # Swap the color channels
-            self.camera_image = cv2.cvtColor(self.camera_image, cv2.COLOR_BGR2RGB)
-
-            # Flip the camera image horizontally
-            self.camera_image = cv2.flip(self.camera_image, 1)
-
-            # Scale the camera image to be half the size of the screen
-            self.camera_image = cv2.resize(
-                self.camera_image,
-                (
-                    int(self.user_screen_width // self.balloon_screen_ratio),
-                    int(self.user_screen_height // self.balloon_screen_ratio),
-                ),
+            # Get the latest camera image and the right and left hand centers
+            self.camera_image, hands_data = self.camera_worker.read()
+            fingers_centers_right = (hands_data["right_hand"] or {}).get(
+                "fingers_centers", _NEG_FIVE
+            )
+            fingers_centers_left = (hands_data["left_hand"] or {}).get(
+                "fingers_centers", _NEG_FIVE
             )
 
-            # Get the right and left hand centers
-            hands_data = detect_hands(self.finger_detector, self.camera_image)
-            try:
-                fingers_centers_right = hands_data["right_hand"]["fingers_centers"]
-            except:
-                fingers_centers_right = [(-1, -1) for _ in range(5)]
-
-            try:
-                fingers_centers_left = hands_data["left_hand"]["fingers_centers"]
-            except:
-                fingers_centers_left = [(-1, -1) for _ in range(5)]
-
-            # Initialize the fingers centers rects
-            fingers_centers_rects = []
-
-            # Apply the transformations to the fingers centers and add them to the fingers centers rects
-            for finger_center in fingers_centers_right:
-                if finger_center == (-1, -1):
-                    continue
-
-                finger_center = (
-                    int(finger_center[0] * self.scale_x_cam) + self.translation_x_cam,
-                    int(finger_center[1] * self.scale_y_cam) + self.translation_y_cam,
-                )
-
-                fingers_centers_rects.append(
-                    pygame.Rect(finger_center[0], finger_center[1], 20, 20)
-                )
-
-            for finger_center in fingers_centers_left:
-                if finger_center == (-1, -1):
-                    continue
+            # Apply the transformations to the fingers centers in the fingers centers rects buffer
+            fingers_centers = np.array(
+                fingers_centers_right + fingers_centers_left, dtype=np.int32
+            )
+            self._finger_rects_buf[:, 0] = (
+                fingers_centers[:, 0] * self.scale_x_cam + self.translation_x_cam
+            )
+            self._finger_rects_buf[:, 1] = (
+                fingers_centers[:, 1] * self.scale_y_cam + self.translation_y_cam
+            )
 
-                finger_center = (
-                    int(finger_center[0] * self.scale_x_cam) + self.translation_x_cam,
-                    int(finger_center[1] * self.scale_y_cam) + self.translation_y_cam,
-                )
-
-                fingers_centers_rects.append(
-                    pygame.Rect(finger_center[0], finger_center[1], 20, 20)
-                )
+            # Skip the fingers that are not up
+            is_finger_up = (fingers_centers != -1).any(axis=1)
+            fingers_centers_rects = self._finger_rects_buf[is_finger_up].tolist()
 
             # Add rounded corners to the camera image
             self.camera_image = img_with_rounded_corners(
                 self.camera_image, 30, 2, (0, 0, 0)
             )
 
-            # Initialize the edited background image
-            self.balloons_game_bg_image_edited = self.balloons_game_bg_image.copy()
-
-            # Add the camera image to the background image
-            self.balloons_game_bg_image_edited[
+            # Add the camera image to the background buffer
+            self._bg_buf[
                 self.start_y_cam : self.end_y_cam, self.start_x_cam : self.end_x_cam
             ] = self.camera_image
 
             # Convert the background image to a Pygame image
             self.balloons_game_bg_image_pygame = pygame.image.frombuffer(
-                self.balloons_game_bg_image_edited.tobytes(),
+                self._bg_buf,
                 (
                     self.balloons_game_bg_image.shape[1],
                     self.balloons_game_bg_image.shape[0],
@@ -1206,58 +1239,34 @@ class Game:
             )
 
             # Draw the balloon game background image to the center of the screen
-            self.screen.blit(
-                self.balloons_game_bg_image_pygame,
-                (
-                    self.screen.get_width() / 2
-                    - self.balloons_game_bg_image_pygame.get_width() / 2,
-                    self.screen.get_height() / 2
-                    - self.balloons_game_bg_image_pygame.get_height() / 2,
-                ),
-            )
+            self.screen.blit(self.balloons_game_bg_image_pygame, self._bg_blit_pos)
 
             # Draw the pins on the fingers centers
-            for finger_rect in fingers_centers_rects:
+            for finger_x, finger_y, _, _ in fingers_centers_rects:
                 self.screen.blit(
                     self.pin_image,
-                    (finger_rect.left - 40, finger_rect.top - 30),
+                    (finger_x - 40, finger_y - 30),
                 )
 
             # Add score to the screen
-            font = pygame.font.Font(self.font_path, 36)
-            text = font.render(
-                f"Score:{self.balloons_score}",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            self.screen.blit(text, (30, (self.screen.get_height() // 2 - 20)))
+            text = self.render_hud_text("score", "Score", self.balloons_score)
+            self.screen.blit(text, (30, (self._cy - 20)))
 
             # Calculate the elapsed time
             elapsed_time = int(time.time() - start_time)
 
             # Add time to the screen
-            text = font.render(
-                f"Time:{elapsed_time}",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            self.screen.blit(text, (30, (self.screen.get_height() // 2 + 50)))
+            text = self.render_hud_text("time", "Time", elapsed_time)
+            self.screen.blit(text, (30, (self._cy + 50)))
 
             # Add wave to the screen
-            text = font.render(
-                f"Wave:{self.balloons_wave}",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            self.screen.blit(text, (30, (self.screen.get_height() // 2 + 120)))
+            text = self.render_hud_text("wave", "Wave", self.balloons_wave)
+            self.screen.blit(text, (30, (self._cy + 120)))
 
             # Add game name to the top center of the screen
-            font = pygame.font.Font(self.font_path, 50)
+            font = self._font(50)
             text = font.render("Balloons Game", True, (255, 255, 255), (0, 0, 0))
-            text_rect = text.get_rect(center=(self.screen.get_width() // 2, 150))
+            text_rect = text.get_rect(center=(self._cx, 150))
             self.screen.blit(text, text_rect)
 
             # Get the current wave balloons
@@ -1311,6 +1320,7 @@ class Game:
 
             # Check if the balloons are all popped or the wave time is over
             if len(balloons) == 0 or elapsed_time > self.max_wave_time:
+                self.stop_camera_worker()
                 self.balloons_wave += 1
                 self.start_balloons_game_timer()
                 break
@@ -1327,98 +1337,55 @@ class Game:
 
         self.balloons_score = max(0, self.balloons_score)
 
-        while True:
-            # Convert the background image to a Pygame image
-            self.balloons_game_bg_image_pygame = pygame.image.frombuffer(
-                self.balloons_game_bg_image.tobytes(),
-                (
-                    self.balloons_game_bg_image.shape[1],
-                    self.balloons_game_bg_image.shape[0],
-                ),
-                "RGBA",
-            )
-
-            # Resize the background image to fit the screen
-            self.balloons_game_bg_image_pygame = pygame.transform.scale(
-                self.balloons_game_bg_image_pygame,
-                (self.user_screen_width, self.user_screen_height),
-            )
+        # Render the game over texts once, they don't change on this screen
+        game_over_texts = []
 
-            # Draw the balloon game background image to the center of the screen
-            self.screen.blit(
-                self.balloons_game_bg_image_pygame,
-                (
-                    self.screen.get_width() / 2
-                    - self.balloons_game_bg_image_pygame.get_width() / 2,
-                    self.screen.get_height() / 2
-                    - self.balloons_game_bg_image_pygame.get_height() / 2,
-                ),
-            )
+        # Add the game over text to the top of the screen
+        font = self._font(50)
+        text = font.render(
+            f"Game Over",
+            True,
+            (255, 255, 255),
+            (0, 0, 0),
+        )
+        text_rect = text.get_rect(center=(self._cx, self._cy - 50))
+        game_over_texts.append((text, text_rect))
 
-            # Draw the balloon game background image to the center of the screen
-            self.screen.blit(
-                self.balloons_game_bg_image_pygame,
-                (
-                    self.screen.get_width() / 2
-                    - self.balloons_game_bg_image_pygame.get_width() / 2,
-                    self.screen.get_height() / 2
-                    - self.balloons_game_bg_image_pygame.get_height() / 2,
-                ),
-            )
+        # Add the score to the center of the screen
+        font = self._font(36)
+        text = font.render(
+            f"Score:{self.balloons_score}",
+            True,
+            (255, 255, 255),
+            (0, 0, 0),
+        )
+        text_rect = text.get_rect(center=(self._cx, self._cy + 70))
+        game_over_texts.append((text, text_rect))
 
-            # Add the game over text to the top of the screen
-            font = pygame.font.Font(self.font_path, 50)
-            text = font.render(
-                f"Game Over",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 - 50,
-                )
-            )
-            self.screen.blit(text, text_rect)
+        # Add "Press ESC to return to the main menu" to the center of the screen
+        font = self._font(24)
+        text = font.render(
+            f"Press ESC to return to the main menu",
+            True,
+            (255, 255, 255),
+            (0, 0, 0),
+        )
+        text_rect = text.get_rect(center=(self._cx, self.screen.get_height() - 50))
+        game_over_texts.append((text, text_rect))
 
-            # Add the score to the center of the screen
-            font = pygame.font.Font(self.font_path, 36)
-            text = font.render(
-                f"Score:{self.balloons_score}",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 + 70,
-                )
-            )
-            self.screen.blit(text, text_rect)
+        while True:
+            # Draw the balloon game background image to the center of the screen
+            self.screen.blit(self._bg_static_pygame, self._bg_blit_pos)
 
-            # Add "Press ESC to return to the main menu" to the center of the screen
-            font = pygame.font.Font(self.font_path, 24)
-            text = font.render(
-                f"Press ESC to return to the main menu",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() - 50,
-                )
-            )
-            self.screen.blit(text, text_rect)
+            # Draw the game over texts
+            for text, text_rect in game_over_texts:
+                self.screen.blit(text, text_rect)
 
             # Update the display
             pygame.display.flip()
 
             # If the user presses the escape key, return to the main menu
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -1429,6 +1396,13 @@ class Game:
 
     def init_pong_game(self):
 
+        # Only queue the quit and key down events, the Pong game ignores the rest
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
+        # Start from a fresh detection, the landmarks of a previous game are not reused
+        self.hand_tracking.reset()
+
         # Set the background music for the main menu
         mixer.music.load(f"{CWD}/resources/sounds/pong_game_bg_music.ogg")
         mixer.music.set_volume(0.1)
@@ -1450,6 +1424,15 @@ class Game:
             self.pong_game_bg_image, cv2.COLOR_RGB2RGBA
         )
 
+        # Convert and scale the background image once for the screens without the camera
+        self._bg_static_pygame = self.scale_bg_image(self.pong_game_bg_image)
+
+        # Calculate the position that centers the background image on the screen
+        self._bg_blit_pos = (
+            (self.user_screen_width - self._bg_static_pygame.get_width()) // 2,
+            (self.user_screen_height - self._bg_static_pygame.get_height()) // 2,
+        )
+
         # Initialize the ball radius
         self.ball_raduis = 10
 
@@ -1481,15 +1464,15 @@ class Game:
         # Initialize the screen ratio
         self.pong_screen_ratio = 3.5
 
-        # Scale the camera image to be a third of the size of the screen
-        self.camera_image = cv2.resize(
-            self.camera_image,
-            (
-                int(self.user_screen_width // self.pong_screen_ratio),
-                int(self.user_screen_height // self.pong_screen_ratio),
-            ),
+        # Initialize the size the camera image is scaled to every frame
+        self._cam_resize_shape = (
+            int(self.user_screen_width // self.pong_screen_ratio),
+            int(self.user_screen_height // self.pong_screen_ratio),
         )
 
+        # Scale the camera image to be a third of the size of the screen
+        self.camera_image = cv2.resize(self.camera_image, self._cam_resize_shape)
+
         # Add rounded corners to the camera image
         self.camera_image = img_with_rounded_corners(
             self.camera_image, 30, 2, (0, 0, 0)
@@ -1520,6 +1503,28 @@ class Game:
         self.translation_x_cam = int(self.start_x_cam * self.scale_x_cam)
         self.translation_y_cam = int(self.start_y_cam * self.scale_y_cam)
 
+        # Initialize a rect for the camera image on the screen
+        self.camera_screen_rect = pygame.Rect(
+            self.translation_x_cam,
+            self.translation_y_cam,
+            int(self.end_x_cam * self.scale_x_cam) - self.translation_x_cam,
+            int(self.end_y_cam * self.scale_y_cam) - self.translation_y_cam,
+        )
+
+        # Initialize the surface the camera image is scaled into every frame,
+        # it has to share the pixel format of the RGBA camera image
+        camera_image_pygame = pygame.image.frombuffer(
+            self.camera_image.tobytes(),
+            (self.camera_image.shape[1], self.camera_image.shape[0]),
+            "RGBA",
+        )
+        self._camera_scaled_surface = pygame.Surface(
+            self.camera_screen_rect.size,
+            pygame.SRCALPHA,
+            32,
+            camera_image_pygame.get_masks(),
+        )
+
         # Calculate the play field height and width
         play_field_height, play_field_width = (
             image_height * self.scale_y_cam,
@@ -1565,6 +1570,37 @@ class Game:
         self.paddle2_x = self.play_field_rect.right - self.paddle_width - 10
         self.paddle2_y = self.play_field_rect.centery - self.paddle_height // 2
 
+        # Initialize the bounds the paddle y is clamped to, any y below the lower bound is raised to it,
+        # including the 10px band under the play field height that used to be left unclamped
+        self._paddle_y_lo = self.play_field_rect.height + 10
+        self._paddle_y_hi = self.play_field_rect.bottom - self.paddle_height - 20
+
+        # Initialize the ball and paddle rects, they are moved in place every frame
+        self.ball_rect = pygame.Rect(
+            self.ball_x, self.ball_y, self.ball_raduis, self.ball_raduis
+        )
+        self.paddle_rect1 = pygame.Rect(
+            self.paddle1_x, self.paddle1_y, self.paddle_width, self.paddle_height
+        )
+        self.paddle_rect2 = pygame.Rect(
+            self.paddle2_x, self.paddle2_y, self.paddle_width, self.paddle_height
+        )
+
+        # Draw the net once, it never moves
+        self.net_surface = pygame.Surface(
+            (4, self.play_field_rect.height), pygame.SRCALPHA
+        )
+        for i in range(0, self.play_field_rect.height, 20):
+            pygame.draw.rect(self.net_surface, (255, 255, 255), (0, i, 4, 8))
+        self.net_surface = self.net_surface.convert_alpha()
+        self.net_pos = (
+            self.play_field_rect.width // 2 + self.start_x_play_field,
+            self.start_y_play_field,
+        )
+
+        # Initialize the frame counter, the hands are detected every other frame
+        self._hand_frame_counter = 0
+
         # Initialize the wave wait time
         self.pong_first_wave_wait_time = 10
 
@@ -1579,6 +1615,10 @@ class Game:
         ]
         for sound in self.hit_sounds:
             sound.set_volume(0.2)
+        self._hit_sounds_tuple = tuple(self.hit_sounds)
+
+        # Bind the functions called in the Pong game loop
+        self._rand_choice = random.choice
 
         # Load whistle sound
         self.point_whistle_sound = mixer.Sound(
@@ -1598,18 +1638,119 @@ class Game:
         # self.max_score = 7
         self.max_score = 1  #!
 
+        # Pre-render the texts that don't change during the Pong game
+        self._pong_text_cache = {}
+
+        # Initialize the player scores texts, rendered once per score
+        self._p1_score_cache = {}
+        self._p2_score_cache = {}
+
+        # Add the game name to the top center of the screen
+        self.cache_pong_text("title", "Pong Game", 50, center=(self._cx, 150))
+
+        # Add the instructions to the center of the screen
+        self.cache_pong_text(
+            "instr1",
+            "Move the paddles with your hands",
+            30,
+            center=(self._cx, self._cy),
+        )
+        self.cache_pong_text(
+            "instr2",
+            "Each player controls a paddle on their side",
+            30,
+            center=(self._cx, self._cy + 50),
+        )
+        self.cache_pong_text(
+            "instr3",
+            "Each player gets a point if the ball goes past the other player's paddle",
+            30,
+            center=(self._cx, self._cy + 100),
+        )
+        self.cache_pong_text(
+            "instr4",
+            f"First player to reach {self.max_score} points wins",
+            30,
+            center=(self._cx, self._cy + 150),
+        )
+        self.cache_pong_text(
+            "instr5",
+            "Press ESC anytime to return to the main menu",
+            30,
+            center=(self._cx, self._cy + 200),
+        )
+
+        # Add the hands detected texts to the left and right of the camera image
+        for label_color, color in (("green", (0, 255, 0)), ("red", (255, 0, 0))):
+            self.cache_pong_text(
+                f"p1_label_{label_color}",
+                "Player 1",
+                30,
+                color,
+                bottomleft=(self.translation_x_cam + 20, self.start_y_play_field - 20),
+            )
+            self.cache_pong_text(
+                f"p2_label_{label_color}",
+                "Player 2",
+                30,
+                color,
+                bottomright=(
+                    self.translation_x_cam + self.play_field_rect.width - 20,
+                    self.start_y_play_field - 20,
+                ),
+            )
+
+        # Draw the parts of the Pong game that never move once, dirty areas are restored from it
+        self._pong_static = pygame.Surface(self.screen.get_size()).convert()
+        self._pong_static.blit(self._bg_static_pygame, self._bg_blit_pos)
+        pygame.draw.rect(
+            self._pong_static, (2, 48, 32), self.play_field_rect, 0, border_radius=30
+        )
+        pygame.draw.rect(
+            self._pong_static,
+            (255, 255, 255),
+            self.play_field_rect,
+            5,
+            border_radius=30,
+        )
+        self._pong_static.blit(self.net_surface, self.net_pos)
+        self._pong_static.blit(*self._pong_text_cache["title"])
+
         # Start the Pong game timer
         self.start_pong_game_timer()
 
+    def cache_pong_text(self, key, text, size, color=(255, 255, 255), **position):
+        # Render the text once and convert it to the display format for fast blits
+        text = self._font(size).render(text, True, color, (0, 0, 0)).convert()
+        self._pong_text_cache[key] = (text, text.get_rect(**position))
+
+    def render_pong_score(self, cache, player, score):
+        # Render the score text only the first time this score is reached
+        text = cache.get(score)
+        if text is None:
+            text = (
+                self._font(30)
+                .render(f"{player}: {score}", True, (255, 255, 255), (0, 0, 0))
+                .convert()
+            )
+            cache[score] = text
+
+        return text
+
     def start_pong_game_timer(self):
+        monotonic = time.monotonic
+
         # Add a start timer for the game
-        start_time = time.time()
+        start_time = monotonic()
 
         # Play the ball drop sound
         self.ball_drop_sound.play()
 
+        # Only the timer text changes after the first frame
+        previous_timer_text_rect = None
+
         while True:
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -1618,132 +1759,34 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         self.start_main_menu()
 
-            # Convert the background image to a Pygame image
-            self.pong_game_bg_image_pygame = pygame.image.frombuffer(
-                self.pong_game_bg_image.tobytes(),
-                (
-                    self.pong_game_bg_image.shape[1],
-                    self.pong_game_bg_image.shape[0],
-                ),
-                "RGBA",
-            )
-
-            # Resize the background image to fit the screen
-            self.pong_game_bg_image_pygame = pygame.transform.scale(
-                self.pong_game_bg_image_pygame,
-                (self.user_screen_width, self.user_screen_height),
-            )
-
             # Draw the Pong game background image to the center of the screen
-            self.screen.blit(
-                self.pong_game_bg_image_pygame,
-                (
-                    self.screen.get_width() / 2
-                    - self.pong_game_bg_image_pygame.get_width() / 2,
-                    self.screen.get_height() / 2
-                    - self.pong_game_bg_image_pygame.get_height() / 2,
-                ),
-            )
+            self.screen.blit(self._bg_static_pygame, self._bg_blit_pos)
 
-            time_elapsed = int(time.time() - start_time)
+            time_elapsed = int(monotonic() - start_time)
             time_remaining = self.pong_first_wave_wait_time - time_elapsed
 
             # Add the timer to the center of the screen
-            font = pygame.font.Font(self.font_path, 40)
-            text = font.render(
+            text = self._font(40).render(
                 f"Game starts in {time_remaining} seconds",
                 True,
                 (255, 255, 255),
                 (0, 0, 0),
             )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 - 200,
-                )
-            )
-            self.screen.blit(text, text_rect)
-
-            # Add the game name to the top center of the screen
-            font = pygame.font.Font(self.font_path, 50)
-            text = font.render("Pong Game", True, (255, 255, 255), (0, 0, 0))
-            text_rect = text.get_rect(center=(self.screen.get_width() // 2, 150))
-            self.screen.blit(text, text_rect)
-
-            # Show instructions
-            font = pygame.font.Font(self.font_path, 30)
-            text = font.render(
-                "Move the paddles with your hands",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2,
-                )
-            )
-            self.screen.blit(text, text_rect)
-
-            text = font.render(
-                "Each player controls a paddle on their side",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 + 50,
-                )
-            )
-            self.screen.blit(text, text_rect)
-
-            text = font.render(
-                "Each player gets a point if the ball goes past the other player's paddle",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 + 100,
-                )
-            )
-            self.screen.blit(text, text_rect)
-
-            text = font.render(
-                f"First player to reach {self.max_score} points wins",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 + 150,
-                )
-            )
+            text_rect = text.get_rect(center=(self._cx, self._cy - 200))
             self.screen.blit(text, text_rect)
+            timer_text_rect = text_rect
 
-            text = font.render(
-                "Press ESC anytime to return to the main menu",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
-            )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 + 200,
-                )
-            )
-            self.screen.blit(text, text_rect)
+            # Add the game name and the instructions to the screen
+            for key in ("title", "instr1", "instr2", "instr3", "instr4", "instr5"):
+                text, text_rect = self._pong_text_cache[key]
+                self.screen.blit(text, text_rect)
 
-            # Update the display
-            pygame.display.flip()
+            # Update the whole display once, then only the area of the timer text
+            if previous_timer_text_rect is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update([timer_text_rect.union(previous_timer_text_rect)])
+            previous_timer_text_rect = timer_text_rect
 
             if time_remaining <= 0:
                 break
@@ -1753,12 +1796,42 @@ class Game:
         # Start the Pong game
         self.start_pong_game()
 
+    def process_pong_frame(self, frame):
+        # Scale the camera image to be a third of the size of the screen
+        frame = cv2.resize(
+            frame,
+            self._cam_resize_shape,
+            interpolation=cv2.INTER_NEAREST,
+        )
+
+        # Flip the camera image horizontally and swap the color channels in a single copy
+        return np.ascontiguousarray(frame[:, ::-1, ::-1])
+
     def start_pong_game(self):
 
-        round_start_time = time.time()
+        # Read and prepare the camera images in the background
+        self.start_camera_worker(self.process_pong_frame)
+
+        # Bind the attributes read every frame to locals
+        pf_rect = self.play_field_rect
+        br = self.ball_raduis
+        pw = self.paddle_width
+        ph = self.paddle_height
+        ball_rect = self.ball_rect
+        paddle_rect1 = self.paddle_rect1
+        paddle_rect2 = self.paddle_rect2
+        speed_increment = self.speed_increment * self.pong_speed_mul
+        paddle_y_lo = self._paddle_y_lo
+        paddle_y_hi = self._paddle_y_hi
+        monotonic = time.monotonic
+
+        round_start_time = monotonic()
+
+        # Only the areas drawn in the previous frame need to be restored
+        previous_dirty_rects = None
 
         while True:
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -1768,43 +1841,27 @@ class Game:
                         self.start_main_menu()
 
             # Increase the ball speed every interval
-            current_time = time.time()
+            current_time = monotonic()
             if current_time - round_start_time > self.speed_increment_interval:
                 self.ball_speed_x += (
-                    self.speed_increment
-                    if self.ball_speed_x > 0
-                    else -self.speed_increment
+                    speed_increment if self.ball_speed_x > 0 else -speed_increment
                 )
                 self.ball_speed_y += (
-                    self.speed_increment
-                    if self.ball_speed_y > 0
-                    else -self.speed_increment
+                    speed_increment if self.ball_speed_y > 0 else -speed_increment
                 )
                 round_start_time = current_time
 
-            # Take a camera image
-            _, self.camera_image = self.cap.read()
-
-            # Swap the color channels
-            self.camera_image = cv2.cvtColor(self.camera_image, cv2.COLOR_BGR2RGB)
-
-            # Flip the camera image horizontally
-            self.camera_image = cv2.flip(self.camera_image, 1)
-
-            # Scale the camera image to be a third of the size of the screen
-            self.camera_image = cv2.resize(
-                self.camera_image,
-                (
-                    int(self.user_screen_width // self.pong_screen_ratio),
-                    int(self.user_screen_height // self.pong_screen_ratio),
-                ),
-            )
+            # Take the latest camera image, copied since the landmarks are drawn on it
+            self.camera_image = self.camera_worker.read().copy()
 
             is_left_hand = False
             is_right_hand = False
 
-            # Get the hands data
-            self.camera_image = self.hand_tracking.findFingers(self.camera_image)
+            # Get the hands data, on skipped frames the previous detection is reused
+            self.camera_image = self.hand_tracking.findFingers(
+                self.camera_image, detect=self._hand_frame_counter % 2 == 0
+            )
+            self._hand_frame_counter += 1
             hands_data = self.hand_tracking.findPosition(
                 self.camera_image, self.camera_image.shape[1]
             )
@@ -1821,14 +1878,7 @@ class Game:
                     + self.translation_y_play_field
                 )
 
-                self.paddle1_y = center1_y - self.paddle_height // 2
-
-                if self.paddle1_y < self.play_field_rect.height:
-                    self.paddle1_y = self.play_field_rect.height + 10
-                elif self.paddle1_y > self.play_field_rect.bottom - 75:
-                    self.paddle1_y = (
-                        self.play_field_rect.bottom - self.paddle_height - 10 - 10
-                    )
+                self.paddle1_y = max(paddle_y_lo, min(paddle_y_hi, center1_y - ph // 2))
 
             if side2 == "right" and len(lmsList2) != 0:
                 is_right_hand = True
@@ -1837,243 +1887,148 @@ class Game:
                     int(center2_y * self.scale_y_play_field)
                     + self.translation_y_play_field
                 )
-                self.paddle2_y = center2_y - self.paddle_height // 2
-
-                if self.paddle2_y < self.play_field_rect.height:
-                    self.paddle2_y = self.play_field_rect.height + 10
-                elif self.paddle2_y > self.play_field_rect.bottom - 75:
-                    self.paddle2_y = (
-                        self.play_field_rect.bottom - self.paddle_height - 10 - 10
-                    )
+                self.paddle2_y = max(paddle_y_lo, min(paddle_y_hi, center2_y - ph // 2))
 
             # Change the ball speed based on the ball direction
             self.ball_x += self.ball_speed_x
             self.ball_y += self.ball_speed_y
 
             # Check if the ball hits the top or bottom of the screen
-            if self.ball_y <= self.play_field_rect.height + self.ball_raduis:
-                self.hit_sounds[random.randint(0, len(self.hit_sounds) - 1)].play()
+            if self.ball_y <= pf_rect.height + br:
+                self._rand_choice(self._hit_sounds_tuple).play()
                 self.ball_speed_y = -self.ball_speed_y
-            elif self.ball_y >= self.play_field_rect.bottom - self.ball_raduis:
+            elif self.ball_y >= pf_rect.bottom - br:
                 self.ball_speed_y = -self.ball_speed_y
-                self.hit_sounds[random.randint(0, len(self.hit_sounds) - 1)].play()
+                self._rand_choice(self._hit_sounds_tuple).play()
 
-            # Convert the ball poistion to a pygame rect
-            ball_rect = pygame.Rect(
-                self.ball_x, self.ball_y, self.ball_raduis, self.ball_raduis
-            )
-
-            # Convert the paddle poistion to a pygame rect
-            paddle_rect1 = pygame.Rect(
-                self.paddle1_x, self.paddle1_y, self.paddle_width, self.paddle_height
-            )
-            paddle_rect2 = pygame.Rect(
-                self.paddle2_x, self.paddle2_y, self.paddle_width, self.paddle_height
-            )
+            # Move the ball and paddle rects to their current positions
+            ball_rect.x = self.ball_x
+            ball_rect.y = self.ball_y
+            paddle_rect1.topleft = (self.paddle1_x, self.paddle1_y)
+            paddle_rect2.topleft = (self.paddle2_x, self.paddle2_y)
 
             # Check if the ball hits the paddle
             if paddle_rect1.colliderect(ball_rect):
-                self.hit_sounds[random.randint(0, len(self.hit_sounds) - 1)].play()
+                self._rand_choice(self._hit_sounds_tuple).play()
                 self.ball_speed_x = -self.ball_speed_x
-                self.ball_x = self.paddle1_x + self.paddle_width + self.ball_raduis
+                self.ball_x = self.paddle1_x + pw + br
             elif paddle_rect2.colliderect(ball_rect):
-                self.hit_sounds[random.randint(0, len(self.hit_sounds) - 1)].play()
+                self._rand_choice(self._hit_sounds_tuple).play()
                 self.ball_speed_x = -self.ball_speed_x
-                self.ball_x = self.paddle2_x - self.ball_raduis
+                self.ball_x = self.paddle2_x - br
 
             # Check if the ball hits the left or right of the screen
-            if self.ball_x <= self.play_field_rect.left + self.ball_raduis:
+            if self.ball_x <= pf_rect.left + br:
                 self.point_whistle_sound.play()
                 self.player2_score += 1
-                self.ball_x = self.play_field_rect.centerx
-                self.ball_y = self.play_field_rect.centery
+                self.ball_x = pf_rect.centerx
+                self.ball_y = pf_rect.centery
                 self.ball_speed_x = random.choice([-7, 7])
                 self.ball_speed_y = random.choice([-7, 7])
-                round_start_time = time.time()
+                round_start_time = monotonic()
 
-            elif self.ball_x >= self.play_field_rect.right - self.ball_raduis:
+            elif self.ball_x >= pf_rect.right - br:
                 self.point_whistle_sound.play()
                 self.player1_score += 1
-                self.ball_x = self.play_field_rect.centerx
-                self.ball_y = self.play_field_rect.centery
+                self.ball_x = pf_rect.centerx
+                self.ball_y = pf_rect.centery
                 self.ball_speed_x = random.choice([-7, 7])
                 self.ball_speed_y = random.choice([-7, 7])
-                round_start_time = time.time()
+                round_start_time = monotonic()
 
             # Add rounded corners to the camera image
             self.camera_image = img_with_rounded_corners(
                 self.camera_image, 30, 2, (0, 0, 0)
             )
 
-            # Initialize the edited background image
-            self.pong_game_bg_image_edited = self.pong_game_bg_image.copy()
-
-            # Add the camera image to the background image
-            self.pong_game_bg_image_edited[
-                self.start_y_cam : self.end_y_cam, self.start_x_cam : self.end_x_cam
-            ] = self.camera_image
+            # Draw the static Pong game image over the areas drawn in the previous frame
+            if previous_dirty_rects is None:
+                self.screen.blit(self._pong_static, (0, 0))
+            else:
+                for rect in previous_dirty_rects:
+                    self.screen.blit(self._pong_static, rect, rect)
 
-            # Convert the background image to a Pygame image
-            self.pong_game_bg_image_pygame = pygame.image.frombuffer(
-                self.pong_game_bg_image_edited.tobytes(),
-                (
-                    self.pong_game_bg_image.shape[1],
-                    self.pong_game_bg_image.shape[0],
-                ),
+            # Convert the camera image to a Pygame image
+            camera_image_pygame = pygame.image.frombuffer(
+                self.camera_image,
+                (self.camera_image.shape[1], self.camera_image.shape[0]),
                 "RGBA",
             )
 
-            # Resize the background image to fit the screen
-            self.pong_game_bg_image_pygame = pygame.transform.scale(
-                self.pong_game_bg_image_pygame,
-                (self.user_screen_width, self.user_screen_height),
-            )
-
-            # Draw the Pong game background image to the center of the screen
-            self.screen.blit(
-                self.pong_game_bg_image_pygame,
-                (
-                    self.screen.get_width() / 2
-                    - self.pong_game_bg_image_pygame.get_width() / 2,
-                    self.screen.get_height() / 2
-                    - self.pong_game_bg_image_pygame.get_height() / 2,
-                ),
+            # Scale the camera image like the background image and draw it on top of it
+            pygame.transform.scale(
+                camera_image_pygame,
+                self.camera_screen_rect.size,
+                self._camera_scaled_surface,
             )
-
-            # Draw the play field
-            [
-                pygame.draw.rect(
-                    self.screen, color, self.play_field_rect, width, border_radius=30
-                )
-                for color, width in [((2, 48, 32), 0), ((255, 255, 255), 5)]
+            dirty_rects = [
+                self.screen.blit(self._camera_scaled_surface, self.camera_screen_rect)
             ]
 
             # Draw the ball
-            pygame.draw.circle(
-                self.screen,
-                (255, 255, 255),
-                (self.ball_x, self.ball_y),
-                self.ball_raduis,
+            dirty_rects.append(
+                pygame.draw.circle(
+                    self.screen,
+                    (255, 255, 255),
+                    (self.ball_x, self.ball_y),
+                    br,
+                )
             )
 
             # Draw the paddles
-            pygame.draw.rect(
-                self.screen,
-                (255, 255, 255),
-                (self.paddle1_x, self.paddle1_y, self.paddle_width, self.paddle_height),
+            dirty_rects.append(
+                pygame.draw.rect(self.screen, (255, 255, 255), paddle_rect1)
             )
-            pygame.draw.rect(
-                self.screen,
-                (255, 255, 255),
-                (self.paddle2_x, self.paddle2_y, self.paddle_width, self.paddle_height),
+            dirty_rects.append(
+                pygame.draw.rect(self.screen, (255, 255, 255), paddle_rect2)
             )
 
-            # Draw the net
-            for i in range(
-                self.start_y_play_field,
-                self.start_y_play_field + self.play_field_rect.height,
-                20,
-            ):
-                pygame.draw.rect(
-                    self.screen,
-                    (255, 255, 255),
-                    (
-                        self.play_field_rect.width // 2 + self.start_x_play_field,
-                        i,
-                        4,
-                        8,
-                    ),
-                )
-
-            # Add game name to the top center of the screen
-            font = pygame.font.Font(self.font_path, 50)
-            text = font.render("Pong Game", True, (255, 255, 255), (0, 0, 0))
-            text_rect = text.get_rect(center=(self.screen.get_width() // 2, 150))
-            self.screen.blit(text, text_rect)
+            # Draw the net over the ball
+            draws = [(self.net_surface, self.net_pos)]
 
             # Add player scores to the top left and right of the play field
             # Todo: Add player names
-            font = pygame.font.Font(self.font_path, 30)
-            text = font.render(
-                f"Player 1: {self.player1_score}",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
+            text = self.render_pong_score(
+                self._p1_score_cache, "Player 1", self.player1_score
             )
-            self.screen.blit(
-                text,
+            draws.append(
                 (
-                    self.start_x_play_field + 20,
-                    self.start_y_play_field - text.get_height() - 20,
-                ),
+                    text,
+                    (
+                        self.start_x_play_field + 20,
+                        self.start_y_play_field - text.get_height() - 20,
+                    ),
+                )
             )
 
-            text = font.render(
-                f"Player 2: {self.player2_score}",
-                True,
-                (255, 255, 255),
-                (0, 0, 0),
+            text = self.render_pong_score(
+                self._p2_score_cache, "Player 2", self.player2_score
             )
-            self.screen.blit(
-                text,
+            draws.append(
                 (
-                    self.start_x_play_field
-                    + self.play_field_rect.width
-                    - text.get_width()
-                    - 20,
-                    self.start_y_play_field - text.get_height() - 20,
-                ),
+                    text,
+                    (
+                        self.start_x_play_field + pf_rect.width - text.get_width() - 20,
+                        self.start_y_play_field - text.get_height() - 20,
+                    ),
+                )
             )
 
             # Add hands detected text to the left and right of the camera image
-            font = pygame.font.Font(self.font_path, 30)
-            if is_left_hand:
-                text = font.render(
-                    "Player 1",
-                    True,
-                    (0, 255, 0),
-                    (0, 0, 0),
-                )
-            else:
-                text = font.render(
-                    "Player 1",
-                    True,
-                    (255, 0, 0),
-                    (0, 0, 0),
-                )
-            self.screen.blit(
-                text,
-                (
-                    (self.translation_x_cam + 20),
-                    self.start_y_play_field - text.get_height() - 20,
-                ),
+            draws.append(
+                self._pong_text_cache[
+                    "p1_label_green" if is_left_hand else "p1_label_red"
+                ]
             )
-
-            if is_right_hand:
-                text = font.render(
-                    "Player 2",
-                    True,
-                    (0, 255, 0),
-                    (0, 0, 0),
-                )
-            else:
-                text = font.render(
-                    "Player 2",
-                    True,
-                    (255, 0, 0),
-                    (0, 0, 0),
-                )
-            self.screen.blit(
-                text,
-                (
-                    self.translation_x_cam
-                    + self.play_field_rect.width
-                    - text.get_width()
-                    - 20,
-                    self.start_y_play_field - text.get_height() - 20,
-                ),
+            draws.append(
+                self._pong_text_cache[
+                    "p2_label_green" if is_right_hand else "p2_label_red"
+                ]
             )
 
+            # Draw all the texts in a single call
+            dirty_rects += self.screen.blits(draws)
+
             if (
                 self.player1_score == self.max_score
                 or self.player2_score == self.max_score
@@ -2081,13 +2036,20 @@ class Game:
                 self.end_pong_game()
                 break
 
-            # Update the display
-            pygame.display.flip()
+            # Update only the areas drawn in this and the previous frame
+            if previous_dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(previous_dirty_rects + dirty_rects)
+            previous_dirty_rects = dirty_rects
 
             # Update the clock and delta time
             self.dt = self.clock.tick(30) / 1000
 
     def end_pong_game(self):
+        # Stop reading the camera images
+        self.stop_camera_worker()
+
         # Play the game over sound
         self.pong_game_over_sound.play()
 
@@ -2095,79 +2057,40 @@ class Game:
         winner = "Player 1" if self.player1_score == self.max_score else "Player 2"
 
         while True:
-            # Convert the background image to a Pygame image
-            self.pong_game_bg_image_pygame = pygame.image.frombuffer(
-                self.pong_game_bg_image.tobytes(),
-                (
-                    self.pong_game_bg_image.shape[1],
-                    self.pong_game_bg_image.shape[0],
-                ),
-                "RGBA",
-            )
-
-            # Resize the background image to fit the screen
-            self.pong_game_bg_image_pygame = pygame.transform.scale(
-                self.pong_game_bg_image_pygame,
-                (self.user_screen_width, self.user_screen_height),
-            )
-
             # Draw the Pong game background image to the center of the screen
-            self.screen.blit(
-                self.pong_game_bg_image_pygame,
-                (
-                    self.screen.get_width() / 2
-                    - self.pong_game_bg_image_pygame.get_width() / 2,
-                    self.screen.get_height() / 2
-                    - self.pong_game_bg_image_pygame.get_height() / 2,
-                ),
-            )
+            self.screen.blit(self._bg_static_pygame, self._bg_blit_pos)
 
             # Add the game over text to the top of the screen
-            font = pygame.font.Font(self.font_path, 50)
+            font = self._font(50)
             text = font.render(
                 f"Game Over",
                 True,
                 (255, 255, 255),
                 (0, 0, 0),
             )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 - 50,
-                )
-            )
+            text_rect = text.get_rect(center=(self._cx, self._cy - 50))
             self.screen.blit(text, text_rect)
 
             # Add the winner to the center of the screen
-            font = pygame.font.Font(self.font_path, 36)
+            font = self._font(36)
             text = font.render(
                 f"{winner} wins",
                 True,
                 (255, 255, 255),
                 (0, 0, 0),
             )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() // 2 + 70,
-                )
-            )
+            text_rect = text.get_rect(center=(self._cx, self._cy + 70))
             self.screen.blit(text, text_rect)
 
             # Add "Press ESC to return to the main menu" to the center of the screen
-            font = pygame.font.Font(self.font_path, 24)
+            font = self._font(24)
             text = font.render(
                 f"Press ESC to return to the main menu",
                 True,
                 (255, 255, 255),
                 (0, 0, 0),
             )
-            text_rect = text.get_rect(
-                center=(
-                    self.screen.get_width() // 2,
-                    self.screen.get_height() - 50,
-                )
-            )
+            text_rect = text.get_rect(center=(self._cx, self.screen.get_height() - 50))
 
             self.screen.blit(text, text_rect)
 
@@ -2175,7 +2098,7 @@ class Game:
             pygame.display.flip()
 
             # If the user presses the escape key, return to the main menu
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -2273,14 +2196,16 @@ class Game:
         self.start_dino_game_timer()
         
     def start_dino_game_timer(self):
+        monotonic = time.monotonic
+
         # Add a start timer for the game, matching Pong's style
-        start_time = time.time()
+        start_time = monotonic()
 
         # Play the countdown sound (using ball drop sound like in Pong)
         self.ball_drop_sound.play()
 
         while True:
-            for event in pygame.event.get():
+            for event in self.get_game_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -2293,7 +2218,7 @@ class Game:
             # Load and display the same background as Pong
             # Convert the background image to a Pygame image
             self.pong_game_bg_image_pygame = pygame.image.frombuffer(
-                self.pong_game_bg_image.tobytes(),
+                self.pong_game_bg_image,
                 (
                     self.pong_game_bg_image.shape[1],
                     self.pong_game_bg_image.shape[0],
@@ -2319,11 +2244,11 @@ class Game:
                 ),
             )
 
-            time_elapsed = int(time.time() - start_time)
+            time_elapsed = int(monotonic() - start_time)
             time_remaining = self.pong_first_wave_wait_time - time_elapsed
 
             # Add the timer to the center of the screen in Pong style
-            font = pygame.font.Font(self.font_path, 40)
+            font = self._font(40)
             text = font.render(
                 f"Game starts in {time_remaining} seconds",
                 True,
@@ -2336,7 +2261,7 @@ class Game:
             self.wide_screen.blit(text, text_rect)
 
             # Create a smaller text object for the instructions
-            instruction_font = pygame.font.Font(self.font_path, 20)
+            instruction_font = self._font(20)
             instruction_text = instruction_font.render(
                 "Use your head to control the dinosaur. Move UP to jump, DOWN to duck.",
                 True,
@@ -2,115 +2,107 @@ import cv2
 import numpy as np
 
 import random
-import time
+from functools import lru_cache
 
-random.seed(time.time())
+# Private generator, seeded from the OS on creation, the global random state is left untouched
+_rng = random.Random()
 
 
-def img_with_rounded_corners(image: np.ndarray, r: int, t: int, c: tuple) -> np.ndarray:
+@lru_cache(maxsize=64)
+def _corner_template(h: int, w: int, r: int, t: int, c: tuple) -> tuple:
     """
-    Draw a rectangle with rounded corners on an image.
+    Draw the rounded corners rectangle for an image size once, the result is cached per geometry.
 
     Args:
-        image (np.ndarray): Image to draw on.
+        h (int): Height of the image.
+        w (int): Width of the image.
         r (int): Radius of the rounded corners.
         t (int): Thickness of the rectangle.
         c (tuple): Color of the rectangle.
 
     Returns:
-        np.ndarray: Image with the drawn rectangle.
+        tuple: Read-only RGBA template with a black interior, and the boolean mask of the interior
+               inside the image window, shaped (h, w, 1) to broadcast over the color channels.
     """
 
     c += (255,)
 
-    h, w = image.shape[:2]
+    # Calculate the corner and edge coordinates once
+    edge = int(t / 2)
+    start = int(r + t / 2)
+    end_x = int(w - r + 3 * t / 2 - 1)
+    end_y = int(h - r + 3 * t / 2 - 1)
+    right = int(w + 3 * t / 2)
+    bottom = int(h + 3 * t / 2)
+    side_end_y = int(h - r + 3 * t / 2)
 
     # Create new image (three-channel hardcoded here...)
     new_image = np.ones((h + 2 * t, w + 2 * t, 4), np.uint8) * 255
     new_image[:, :, 3] = 0
 
     # Draw four rounded corners
-    new_image = cv2.ellipse(
-        new_image, (int(r + t / 2), int(r + t / 2)), (r, r), 180, 0, 90, c, t
-    )
-    new_image = cv2.ellipse(
-        new_image,
-        (int(w - r + 3 * t / 2 - 1), int(r + t / 2)),
-        (r, r),
-        270,
-        0,
-        90,
-        c,
-        t,
-    )
-    new_image = cv2.ellipse(
-        new_image,
-        (int(r + t / 2), int(h - r + 3 * t / 2 - 1)),
-        (r, r),
-        90,
-        0,
-        90,
-        c,
-        t,
-    )
-    new_image = cv2.ellipse(
-        new_image,
-        (int(w - r + 3 * t / 2 - 1), int(h - r + 3 * t / 2 - 1)),
-        (r, r),
-        0,
-        0,
-        90,
-        c,
-        t,
-    )
+    new_image = cv2.ellipse(new_image, (start, start), (r, r), 180, 0, 90, c, t)
+    new_image = cv2.ellipse(new_image, (end_x, start), (r, r), 270, 0, 90, c, t)
+    new_image = cv2.ellipse(new_image, (start, end_y), (r, r), 90, 0, 90, c, t)
+    new_image = cv2.ellipse(new_image, (end_x, end_y), (r, r), 0, 0, 90, c, t)
 
     # Draw four edges
-    new_image = cv2.line(
-        new_image,
-        (int(r + t / 2), int(t / 2)),
-        (int(w - r + 3 * t / 2 - 1), int(t / 2)),
-        c,
-        t,
-    )
-    new_image = cv2.line(
-        new_image,
-        (int(t / 2), int(r + t / 2)),
-        (int(t / 2), int(h - r + 3 * t / 2)),
-        c,
-        t,
-    )
-    new_image = cv2.line(
-        new_image,
-        (int(r + t / 2), int(h + 3 * t / 2)),
-        (int(w - r + 3 * t / 2 - 1), int(h + 3 * t / 2)),
-        c,
-        t,
-    )
-    new_image = cv2.line(
-        new_image,
-        (int(w + 3 * t / 2), int(r + t / 2)),
-        (int(w + 3 * t / 2), int(h - r + 3 * t / 2)),
-        c,
-        t,
-    )
-
-    # Generate masks for proper blending
-    mask = new_image[:, :, 3].copy()
-    mask = cv2.floodFill(mask, None, (int(w / 2 + t), int(h / 2 + t)), 128)[1]
-    mask[mask != 128] = 0
-    mask[mask == 128] = 1
-    mask = np.stack((mask, mask, mask), axis=2)
-
-    # Blend images
-    temp = np.zeros_like(new_image[:, :, :3])
-    temp[(t - 1) : (h + t - 1), (t - 1) : (w + t - 1)] = image.copy()
-    new_image[:, :, :3] = new_image[:, :, :3] * (1 - mask) + temp * mask
+    new_image = cv2.line(new_image, (start, edge), (end_x, edge), c, t)
+    new_image = cv2.line(new_image, (edge, start), (edge, side_end_y), c, t)
+    new_image = cv2.line(new_image, (start, bottom), (end_x, bottom), c, t)
+    new_image = cv2.line(new_image, (right, start), (right, side_end_y), c, t)
+
+    # Generate masks for proper blending, the interior is the rounded rectangle through the
+    # middle of the edges (two crossing rectangles and four corner sectors) minus the drawn edges,
+    # the sectors are filled from the same polygons as the arcs so thin edges leave no gaps
+    mask = np.zeros((h + 2 * t, w + 2 * t), np.uint8)
+    cv2.rectangle(mask, (edge, start), (right, end_y), 1, -1)
+    cv2.rectangle(mask, (start, edge), (end_x, bottom), 1, -1)
+    for center, angle in (
+        ((start, start), 180),
+        ((end_x, start), 270),
+        ((start, end_y), 90),
+        ((end_x, end_y), 0),
+    ):
+        cv2.ellipse(mask, center, (r, r), angle, 0, 90, 1, -1)
+    mask = (mask == 1) & (new_image[:, :, 3] == 0)
+
+    # Clear the interior, the image is pasted into it
+    new_image[mask, :3] = 0
 
     # Set proper alpha channel in new image
-    temp = new_image[:, :, 3].copy()
-    new_image[:, :, 3] = cv2.floodFill(
-        temp, None, (int(w / 2 + t), int(h / 2 + t)), 255
-    )[1]
+    new_image[mask, 3] = 255
+
+    # Keep only the image window of the mask, with a channel axis for the paste
+    mask = np.ascontiguousarray(mask[t - 1 : h + t - 1, t - 1 : w + t - 1, None])
+
+    new_image.setflags(write=False)
+    mask.setflags(write=False)
+
+    return new_image, mask
+
+
+def img_with_rounded_corners(image: np.ndarray, r: int, t: int, c: tuple) -> np.ndarray:
+    """
+    Draw a rectangle with rounded corners on an image.
+
+    Args:
+        image (np.ndarray): Image to draw on, it is only read and the result never shares its memory.
+        r (int): Radius of the rounded corners.
+        t (int): Thickness of the rectangle.
+        c (tuple): Color of the rectangle.
+
+    Returns:
+        np.ndarray: Image with the drawn rectangle.
+    """
+
+    h, w = image.shape[:2]
+
+    template, mask = _corner_template(h, w, r, t, tuple(c))
+    new_image = template.copy()
+
+    # Paste the image into the interior, a byte select with the precomputed window mask
+    np.copyto(new_image[t - 1 : h + t - 1, t - 1 : w + t - 1, :3], image, where=mask)
 
     return new_image
 
@@ -125,7 +117,7 @@ def random_bool_by_chance(chance: float) -> bool:
     Returns:
         bool: Random boolean value.
     """
-    return random.random() < chance
+    return _rng.random() < chance
 
 
 def biased_random_int(min_value, max_value, bias_range, bias_strength=2):
@@ -150,16 +142,21 @@ def biased_random_int(min_value, max_value, bias_range, bias_strength=2):
             "bias_range must be within the bounds of min_value and max_value."
         )
 
-    weights = []
-    for num in range(min_value, max_value + 1):
-        # Assign higher weight to numbers within the bias range
-        if bias_range[0] <= num <= bias_range[1]:
-            weights.append(bias_strength)
-        else:
-            weights.append(1)
-
-    # Generate a weighted random choice
-    return random.choices(range(min_value, max_value + 1), weights=weights)[0]
+    # Numbers within the bias range have bias_strength times the weight of the others
+    n_bias = bias_range[1] - bias_range[0] + 1
+    n_other = (max_value - min_value + 1) - n_bias
+    p_bias = (n_bias * bias_strength) / (n_bias * bias_strength + n_other)
+
+    # Pick the biased range by its total weight, then a uniform number inside the chosen region
+    if _rng.random() < p_bias:
+        return _rng.randint(bias_range[0], bias_range[1])
+
+    # The other numbers are the two ranges below and above the bias range
+    k = _rng.randrange(n_other)
+    n_below = bias_range[0] - min_value
+    if k < n_below:
+        return min_value + k
+    return bias_range[1] + 1 + (k - n_below)
 
 
 # for _ in range(10):
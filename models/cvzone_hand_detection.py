@@ -3,6 +3,9 @@ from cvzone.HandTrackingModule import HandDetector
 import numpy as np
 import pprint
 
+# Landmark indices of the finger tips, from the thumb to the pinky
+_TIP_IDX = np.array([4, 8, 12, 16, 20])
+
 
 def initialize_hand_detector(detection_con: float = 0.9) -> HandDetector:
     """
@@ -23,6 +26,39 @@ def initialize_hand_detector(detection_con: float = 0.9) -> HandDetector:
     return detector
 
 
+def _extract_hand(detector: HandDetector, hand: dict) -> dict:
+    """
+    Extract the fingers data of a detected hand.
+
+    Parameters:
+        detector: HandDetector
+            The HandDetector object.
+        hand: dict
+            The hand data returned by the detector.
+
+    Returns:
+        hand_data: dict
+            The fingers up, the number of fingers up and the centers of the finger tips.
+    """
+
+    fingerup = detector.fingersUp(hand)  # Getting the number of fingers up
+
+    # Calculating the sum of the fingers up
+    is_up = np.asarray(fingerup, dtype=bool)
+
+    # Getting the centers of the fingers that are up, (-1, -1) for the others
+    lm = np.asarray(hand["lmList"], dtype=np.int32)
+    fingers_centers = list(
+        map(tuple, np.where(is_up[:, None], lm[_TIP_IDX, :2], -1).tolist())
+    )
+
+    return {
+        "fingers_up": fingerup,
+        "total_fingers_up": int(is_up.sum()),
+        "fingers_centers": fingers_centers,
+    }
+
+
 def detect_hands(detector: HandDetector, img: np.ndarray) -> dict:
     """
     Detect the hands in the video frame.
@@ -42,24 +78,12 @@ def detect_hands(detector: HandDetector, img: np.ndarray) -> dict:
 
     hands = hand_data[0]  # Getting the hand data
 
-    # Initializing the variables to store if one or two hands are detected
-    is_one = False
-    is_both = False
-
     # Checking if one or two hands are detected
-    try:
-        first_hand = hands[0]
-    except:
-        is_one = False
-    else:
-        is_one = True
-
-        try:
-            second_hand = hands[1]
-        except:
-            is_both = False
-        else:
-            is_both = True
+    n_hands = len(hands)
+    is_one = n_hands >= 1
+    is_both = n_hands >= 2
+    first_hand = hands[0] if is_one else None
+    second_hand = hands[1] if is_both else None
 
     # Initializing the variables to store the left and right hand data
     is_left = False
@@ -91,66 +115,10 @@ def detect_hands(detector: HandDetector, img: np.ndarray) -> dict:
         is_right = True
 
     if is_left:
-        fingerup_left = detector.fingersUp(
-            left_hand
-        )  # Getting the number of fingers up
-
-        # Calculating the sum of the fingers up
-        sum_left = (
-            fingerup_left[0]
-            + fingerup_left[1]
-            + fingerup_left[2]
-            + fingerup_left[3]
-            + fingerup_left[4]
-        )
-
-        fingers_centers_left = [
-            (-1, -1) for _ in range(5)
-        ]  # Initializing the list to store the centers of the fingers
-
-        # Getting the centers of the fingers
-        for i in range(5):
-            if fingerup_left[i] == 1:
-                fingers_centers_left[i] = tuple(left_hand["lmList"][(i + 1) * 4][0:2])
-                # cv2.circle(img, fingers_centers_left[i], 5, (255, 0, 0), cv2.FILLED)
-
-        # Storing the left hand data
-        hand_data["left_hand"] = {
-            "fingers_up": fingerup_left,
-            "total_fingers_up": sum_left,
-            "fingers_centers": fingers_centers_left,
-        }
+        hand_data["left_hand"] = _extract_hand(detector, left_hand)
 
     if is_right:
-        fingerup_right = detector.fingersUp(
-            right_hand
-        )  # Getting the number of fingers up
-
-        # Calculating the sum of the fingers up
-        sum_right = (
-            fingerup_right[0]
-            + fingerup_right[1]
-            + fingerup_right[2]
-            + fingerup_right[3]
-            + fingerup_right[4]
-        )
-
-        fingers_centers_right = [
-            (-1, -1) for _ in range(5)
-        ]  # Initializing the list to store the centers of the fingers
-
-        # Getting the centers of the fingers
-        for i in range(5):
-            if fingerup_right[i] == 1:
-                fingers_centers_right[i] = tuple(right_hand["lmList"][(i + 1) * 4][0:2])
-                # cv2.circle(img, fingers_centers_right[i], 5, (255, 0, 0), cv2.FILLED)
-
-        # Storing the right hand data
-        hand_data["right_hand"] = {
-            "fingers_up": fingerup_right,
-            "total_fingers_up": sum_right,
-            "fingers_centers": fingers_centers_right,
-        }
+        hand_data["right_hand"] = _extract_hand(detector, right_hand)
 
     return hand_data
 
@@ -2,6 +2,7 @@ import mediapipe as mp
 import cv2 as cv
 import math
 import numpy as np
+from types import SimpleNamespace
 
 
 class HandTrackingDynamic:
@@ -11,6 +12,9 @@ class HandTrackingDynamic:
         maxHands: int = 2,
         detectionCon: float = 0.5,
         trackCon: float = 0.5,
+        modelComplexity: int = 1,
+        motionThresh: float = 0.0,
+        maxReuseFrames: int = 10,
     ):
         """
         Initializes the HandTrackingDynamic class.
@@ -20,29 +24,70 @@ class HandTrackingDynamic:
             maxHands (int): Maximum number of hands to detect. Default is 2.
             detectionCon (float): Minimum confidence value for hand detection. Default is 0.5.
             trackCon (float): Minimum confidence value for hand tracking. Default is 0.5.
+            modelComplexity (int): Complexity of the hand landmark model, 0 is faster and 1 is more accurate. Default is 1.
+            motionThresh (float): Mean gray level change around the last detected hands below which the detection
+                                  is skipped and the previous landmarks are reused, 0 disables it. Default is 0.0.
+            maxReuseFrames (int): Maximum number of frames the landmarks are reused before the hands are detected
+                                  again, so new hands are found. Default is 10.
         """
         self.__mode__ = mode
         self.__maxHands__ = maxHands
         self.__detectionCon__ = detectionCon
         self.__trackCon__ = trackCon
+        self.__modelComplexity__ = modelComplexity
+        self.__motionThresh__ = motionThresh
+        self.__maxReuseFrames__ = maxReuseFrames
         self.handsMp = mp.solutions.hands
-        self.hands = self.handsMp.Hands(max_num_hands=maxHands)
+        self.hands = self.handsMp.Hands(
+            static_image_mode=mode,
+            max_num_hands=maxHands,
+            model_complexity=modelComplexity,
+            min_detection_confidence=detectionCon,
+            min_tracking_confidence=trackCon,
+        )
         self.mpDraw = mp.solutions.drawing_utils
-        self.tipIds = [4, 8, 12, 16, 20]
+        self.tipIds = np.array([4, 8, 12, 16, 20], dtype=np.int32)
+        self._rgb_buf = None
+        self.reset()
 
-    def findFingers(self, frame: np.ndarray, draw: bool = True):
+    def reset(self) -> None:
+        """
+        Forget the previous detection, so the next frames don't reuse the landmarks of an earlier session.
+        """
+        # No hands until the next detection, so the results can be reused right away
+        self.results = SimpleNamespace(multi_hand_landmarks=None)
+        self._prev_bbox = None
+        self._prev_gray_roi = None
+        self._frames_since_detect = 0
+
+    def findFingers(self, frame: np.ndarray, draw: bool = True, detect: bool = True):
         """
         Finds and detects fingers in the given frame.
 
         Args:
             frame (numpy.ndarray): The input frame to process.
             draw (bool): Whether to draw the landmarks on the frame. Default is True.
+            detect (bool): Whether to run the hand model on the frame, if False the results of the
+                           previous frame are reused. The model is also skipped when the area around
+                           the hands did not change since the last detection. Default is True.
 
         Returns:
             numpy.ndarray: The frame with the landmarks drawn.
         """
-        imgRGB = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
-        self.results = self.hands.process(imgRGB)
+        if detect and self._hands_are_still(frame):
+            self._frames_since_detect += 1
+        elif detect:
+            # Convert the colors into a buffer reused across frames of the same size
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            cv.cvtColor(frame, cv.COLOR_BGR2RGB, dst=self._rgb_buf)
+            self.results = self.hands.process(self._rgb_buf)
+
+            # Remember the area around the detected hands to compare the next frames with
+            self._frames_since_detect = 0
+            self._prev_bbox = self._hands_bbox(frame)
+            if self._prev_bbox is not None:
+                self._prev_gray_roi = self._gray_roi(frame, self._prev_bbox)
         if self.results.multi_hand_landmarks:
             for handLms in self.results.multi_hand_landmarks:
                 if draw:
@@ -51,6 +96,62 @@ class HandTrackingDynamic:
                     )
         return frame
 
+    def _hands_bbox(self, frame: np.ndarray):
+        """
+        Get the padded bounding box of all the detected hands in the given frame.
+
+        Args:
+            frame (numpy.ndarray): The frame the hands were detected in.
+
+        Returns:
+            tuple: The frame shape and the (x1, y1, x2, y2) box, or None if no hands were detected.
+        """
+        if not self.results.multi_hand_landmarks:
+            return None
+
+        h, w = frame.shape[:2]
+        pts = np.array(
+            [
+                (lm.x, lm.y)
+                for handLms in self.results.multi_hand_landmarks
+                for lm in handLms.landmark
+            ]
+        ) * (w, h)
+        x1, y1 = np.clip(pts.min(axis=0) - 20, 0, (w - 1, h - 1)).astype(int).tolist()
+        x2, y2 = np.clip(pts.max(axis=0) + 20, 1, (w, h)).astype(int).tolist()
+        if x2 <= x1 or y2 <= y1:
+            return None
+
+        return frame.shape, (x1, y1, x2, y2)
+
+    def _gray_roi(self, frame: np.ndarray, bbox: tuple) -> np.ndarray:
+        """Get the area inside the bounding box as a small gray image for the motion check"""
+        _, (x1, y1, x2, y2) = bbox
+        gray = cv.cvtColor(frame[y1:y2, x1:x2], cv.COLOR_BGR2GRAY)
+        return cv.resize(gray, (64, 64), interpolation=cv.INTER_AREA)
+
+    def _hands_are_still(self, frame: np.ndarray) -> bool:
+        """
+        Check if the area around the last detected hands barely changed, so the detection can be skipped.
+
+        Args:
+            frame (numpy.ndarray): The current frame.
+
+        Returns:
+            bool: True if the previous landmarks can be reused for the frame.
+        """
+        if (
+            self.__motionThresh__ <= 0
+            or self._prev_bbox is None
+            or self._prev_bbox[0] != frame.shape
+            or self._frames_since_detect >= self.__maxReuseFrames__
+        ):
+            return False
+
+        gray_roi = self._gray_roi(frame, self._prev_bbox)
+        motion = cv.norm(gray_roi, self._prev_gray_roi, cv.NORM_L1) / gray_roi.size
+        return motion < self.__motionThresh__
+
     def findPosition(self, frame: np.ndarray, size_frame: int, draw: bool = True):
         """
         Finds the position of the hands in the given frame.
@@ -62,25 +163,26 @@ class HandTrackingDynamic:
 
         Returns:
             list: A list containing the hand data for each hand found in the frame.
-                  Each hand data is represented as a tuple containing the landmarks, bounding box,
-                  center coordinates, and hand side.
+                  Each hand data is represented as a tuple containing the landmarks as a (21, 2) array
+                  of pixel coordinates, bounding box, center coordinates, and hand side.
         """
         hands_data = [(-1, -1, (-1, -1), "nth"), (-1, -1, (-1, -1), "nth")]
         if self.results.multi_hand_landmarks:
+            # Scale from normalized landmarks to pixels, the same for every hand
+            h, w = frame.shape[:2]
+            scale = np.array([w, h], dtype=np.float32)
             for handNo, myHand in enumerate(self.results.multi_hand_landmarks):
                 if handNo >= self.__maxHands__:
                     break
-                xList = []
-                yList = []
-                lmsList = []
-                for id, lm in enumerate(myHand.landmark):
-                    h, w, c = frame.shape
-                    cx, cy = int(lm.x * w), int(lm.y * h)
-                    xList.append(cx)
-                    yList.append(cy)
-                    lmsList.append([id, cx, cy])
-                xmin, xmax = min(xList), max(xList)
-                ymin, ymax = min(yList), max(yList)
+                pts = np.fromiter(
+                    (v for lm in myHand.landmark for v in (lm.x, lm.y)),
+                    dtype=np.float64,
+                    count=2 * len(myHand.landmark),
+                ).reshape(-1, 2)
+                lmsList = (pts * scale).astype(np.int32)
+                self.lmsArr = lmsList
+                xmin, ymin = lmsList.min(axis=0).tolist()
+                xmax, ymax = lmsList.max(axis=0).tolist()
                 bbox = xmin, ymin, xmax, ymax
                 center_x = (xmin + xmax) // 2
                 center_y = (ymin + ymax) // 2
@@ -102,6 +204,18 @@ class HandTrackingDynamic:
                     cv.circle(frame, (center_x, center_y), 5, (0, 255, 0), cv.FILLED)
         return hands_data
 
+    def fingersUp(self) -> np.ndarray:
+        """
+        Finds which fingers are up for the last hand found by findPosition.
+
+        Returns:
+            numpy.ndarray: A (5,) uint8 array from the thumb to the pinky, 1 if the finger tip
+                           is above the joint below it and 0 otherwise.
+        """
+        finger_y = self.lmsArr[self.tipIds, 1]
+        pip_y = self.lmsArr[self.tipIds - 2, 1]
+        return (finger_y < pip_y).astype(np.uint8)
+
     def findDistance(
         self,
         p1: int,
@@ -126,8 +240,8 @@ class HandTrackingDynamic:
             tuple: A tuple containing the distance between the landmarks, the frame with the distance line and circles drawn,
                    and the coordinates of the landmarks and their midpoint.
         """
-        x1, y1 = self.lmsList[p1][1:]
-        x2, y2 = self.lmsList[p2][1:]
+        x1, y1 = self.lmsArr[p1].tolist()
+        x2, y2 = self.lmsArr[p2].tolist()
         cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
         if draw:
             cv.line(frame, (x1, y1), (x2, y2), (255, 0, 255), t)
@@ -137,6 +251,35 @@ class HandTrackingDynamic:
         length = math.hypot(x2 - x1, y2 - y1)
         return length, frame, [x1, y1, x2, y2, cx, cy]
 
+    def findDistanceSq(self, p1: int, p2: int) -> int:
+        """
+        Finds the squared distance between two landmarks, for comparing against a squared threshold.
+
+        Args:
+            p1 (int): Index of the first landmark.
+            p2 (int): Index of the second landmark.
+
+        Returns:
+            int: The squared distance between the landmarks in pixels.
+        """
+        x1, y1 = self.lmsArr[p1].tolist()
+        x2, y2 = self.lmsArr[p2].tolist()
+        return (x2 - x1) ** 2 + (y2 - y1) ** 2
+
+    def findDistanceBatch(self, pairs_idx) -> np.ndarray:
+        """
+        Finds the distances between several pairs of landmarks at once.
+
+        Args:
+            pairs_idx (array-like): A (N, 2) array of landmark index pairs.
+
+        Returns:
+            numpy.ndarray: A (N,) array with the distance between each pair of landmarks.
+        """
+        pairs_idx = np.asarray(pairs_idx, dtype=np.intp)
+        d = self.lmsArr[pairs_idx[:, 1]] - self.lmsArr[pairs_idx[:, 0]]
+        return np.hypot(d[:, 0], d[:, 1])
+
 
 if __name__ == "__main__":
     cap = cv.VideoCapture(0)
@@ -146,7 +289,6 @@ if __name__ == "__main__":
         success, img = cap.read()
         img = detector.findFingers(img)
         cv.imshow("Image", img)
-        cv.waitKey(1)
 
         if cv.waitKey(1) & 0xFF == ord("q"):
             break
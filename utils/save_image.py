@@ -1,38 +1,60 @@
 import cv2
+import sys
 import time
 
+# Directory the test images are saved to
+SAVE_DIR = "./finger_counting/test_imgs"
+
+# Capture backend that opens the camera fastest on the platform
+if sys.platform.startswith("win"):
+    CAPTURE_API = cv2.CAP_DSHOW
+elif sys.platform.startswith("linux"):
+    CAPTURE_API = cv2.CAP_V4L2
+else:
+    CAPTURE_API = cv2.CAP_ANY
+
 
 def save_image_on_button_press():
     # Create a VideoCapture object
-    cap = cv2.VideoCapture(0)
-
-    # Check if the camera is opened successfully
-    if not cap.isOpened():
-        print("Unable to open the camera")
-        return
-
-    while True:
-        # Read the frame from the camera
-        _, frame = cap.read()
-
-        # Display the frame
-        cv2.imshow("Camera", frame)
-
-        # Check if the 's' key is pressed
-        if cv2.waitKey(1) & 0xFF == ord("s"):
-            # Save the frame as an image
-            cv2.imwrite(
-                f"./finger_counting/test_imgs/test_img_{time.time()}.png", frame
-            )
-            print("Image saved successfully")
-
-        # Check if the 'q' key is pressed
-        if cv2.waitKey(1) & 0xFF == ord("q"):
-            break
-
-    # Release the VideoCapture object and close the windows
-    cap.release()
-    cv2.destroyAllWindows()
+    cap = cv2.VideoCapture(0, CAPTURE_API)
+
+    # Fall back to the default backend if the faster one is not available
+    if not cap.isOpened() and CAPTURE_API != cv2.CAP_ANY:
+        cap.release()
+        cap = cv2.VideoCapture(0)
+
+    try:
+        # Check if the camera is opened successfully
+        if not cap.isOpened():
+            print("Unable to open the camera")
+            return
+
+        # Keep only the newest frame so the preview is not behind the camera
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        while True:
+            # Read the frame from the camera
+            _, frame = cap.read()
+
+            # Display the frame
+            cv2.imshow("Camera", frame)
+
+            # Read the pressed key once per frame
+            key = cv2.waitKey(1) & 0xFF
+
+            # Check if the 's' key is pressed
+            if key == ord("s"):
+                # Save the frame as an image
+                cv2.imwrite(f"{SAVE_DIR}/test_img_{time.time_ns()}.png", frame)
+                print("Image saved successfully")
+
+            # Check if the 'q' key is pressed
+            elif key == ord("q"):
+                break
+    finally:
+        # Release the VideoCapture object and close the windows on every exit path
+        cap.release()
+        cv2.destroyAllWindows()
 
 
 # Call the function to save the image on button press